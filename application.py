@@ -1,9 +1,10 @@
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, jsonify
 import pandas as pd
 import sys
 from src.logging.logger import logging
 from src.exception.exception import CustomException
 from src.utils.utils import load_object
+from src.components.feature_store import FeatureStore
 
 # ==================================================
 # Flask App
@@ -26,13 +27,20 @@ try:
 except Exception as e:
     raise CustomException(e, sys)
 
+# Feature store is optional: without it only CSV uploads can be scored
+try:
+    feature_store = FeatureStore().load()
+except Exception as e:
+    feature_store = None
+    logging.warning(f"⚠️ Feature store not available: {str(e)}")
+
 # ==================================================
 # Routes
 # ==================================================
 @app.route("/")
 def home():
     """Render homepage with upload and quick prediction form"""
-    return render_template("index.html")
+    return render_template("index.html", feature_store_ready=feature_store is not None)
 
 
 @app.route("/predict", methods=["POST"])
@@ -58,10 +66,49 @@ def predict():
                 mode="file"
             )
 
-       
+        # ✅ CASE 2: Quick prediction from (sector, month) ids
+        if feature_store is None:
+            raise Exception("Feature store is not loaded, upload a CSV instead")
+
+        sector = request.form.get("sector")
+        month = request.form.get("month") or None
+        if not sector:
+            raise Exception("Upload a CSV file or enter a sector")
+        data = feature_store.get_features([sector], None if month is None else [month])
+
+        transformed_data = process_model.transform(data)
+        preds = model.predict(transformed_data)
+
+        return render_template(
+            "result.html",
+            predictions=preds.tolist(),
+            mode="single"
+        )
+
+    except Exception as e:
+        logging.error(f"❌ Prediction failed: {str(e)}")
+        # CustomException's str() carries server file paths, keep those in the log only
+        return render_template("result.html", error=getattr(e, "error_message", str(e)))
+
+
+@app.route("/api/predict", methods=["POST"])
+def predict_api():
+    """Batch prediction from JSON: {"sector": [...], "month": [...]} (month optional)"""
+    try:
+        if feature_store is None:
+            raise Exception("Feature store is not loaded")
+
+        payload = request.get_json(force=True)
+        data = feature_store.get_features(payload["sector"], payload.get("month"))
+
+        transformed_data = process_model.transform(data)
+        preds = model.predict(transformed_data)
+
+        return jsonify({"predictions": preds.tolist()})
+
     except Exception as e:
         logging.error(f"❌ Prediction failed: {str(e)}")
-        return render_template("result.html", error=str(e))
+        return jsonify({"error": getattr(e, "error_message", str(e))}), 400
 
 
 # ==================================================
@@ -1,6 +1,7 @@
 from src.components.data_injection import DataInjection, DataInjectionConfig
 from src.components.data_transformation import DataTransformation,DataTransformationConfig
 from src.components.model_trainer import ModelTrainer,ModelTrainerConfig
+from src.components.feature_store import FeatureStore
 
 # 1. Create configuration
 #data_ingestion_config = DataInjectionConfig()
@@ -11,6 +12,9 @@ data_ingestion = DataInjection()
 # 3. Start data ingestion and collect the artifact
 data_ingestion_artifact = data_ingestion.initiate_data_injection()
 
+feature_store = FeatureStore()
+feature_store.initiate_feature_store()
+
 #data_trans_config = DataTransformationConfig()
 
 data_transformation = DataTransformation()
@@ -6,6 +6,7 @@ import pandas as pd
 
 from src.logging.logger import logging
 from src.exception.exception import CustomException
+from src.utils.utils import MONTH_CODES, month_to_time
 
 
 # ===================================================
@@ -20,6 +21,7 @@ class DataInjectionConfig:
     raw_data_path: str = "/home/leksman/Desktop/my git hub work/end_to_end_Real_Estate_Demand_Predictio/raw_datas"
     train_data_path: str = os.path.join("artifacts", "raw_data", "train_data", "train.csv")
     test_data_path: str = os.path.join("artifacts", "raw_data", "test_data", "test.csv")
+    feature_store_data_path: str = os.path.join("artifacts", "feature_store", "features.csv")
 
 
 # ===================================================
@@ -68,12 +70,7 @@ class DataInjection:
             test = pd.read_csv(f"{raw_data_path}/test.csv")
             test[["month", "sector"]] = test["id"].str.split("_", expand=True)
 
-            # 3️⃣ Month conversion map
-            MONTH_CODES = {
-                "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
-                "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
-                "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
-            }
+            # 3️⃣ Month conversion map lives in src.utils.utils (MONTH_CODES)
 
             # 4️⃣ Create base dataset (sector × month combinations)
             logging.info("Creating base dataset...")
@@ -85,7 +82,7 @@ class DataInjection:
             data["sector_id"] = data["sector"].str.split(" ").str[1].astype("int16")
             data["year"] = data["month"].str.split("-").str[0].astype("int16")
             data["month_num"] = data["month"].str.split("-").str[1].map(MONTH_CODES).astype("int8")
-            data["time"] = ((data["year"] - 2019) * 12 + data["month_num"] - 1).astype("int16")
+            data["time"] = month_to_time(data["year"], data["month_num"]).astype("int16")
             data = data.sort_values(["sector_id", "time"])
 
             # 5️⃣ Merge all features
@@ -134,6 +131,10 @@ class DataInjection:
             data["cs3"] = np.cos((data["month_num"] - 1) / 1.5 * np.pi)
             data["sn3"] = np.sin((data["month_num"] - 1) / 1.5 * np.pi)
 
+            # Keep sector_id here so the feature store can index rows per sector
+            os.makedirs(os.path.dirname(self.config.feature_store_data_path), exist_ok=True)
+            data.to_csv(self.config.feature_store_data_path, index=False)
+
             data.drop(columns=["sector_id"], inplace=True)
 
             # 9️⃣ Train/test split
@@ -160,7 +161,11 @@ class DataInjection:
     # ---------------------------------------------------
     def initiate_data_injection(self) -> DataInjectionConfig:
         try:
-            if os.path.exists(self.config.train_data_path) and os.path.exists(self.config.test_data_path):
+            if (
+                os.path.exists(self.config.train_data_path)
+                and os.path.exists(self.config.test_data_path)
+                and os.path.exists(self.config.feature_store_data_path)
+            ):
                 logging.info("✅ Training and testing data already exist. Skipping data injection.")
             else:
                 logging.info("🚀 Starting data injection process...")
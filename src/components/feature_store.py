@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+import os, sys
+import numpy as np
+import pandas as pd
+
+from src.logging.logger import logging
+from src.exception.exception import CustomException
+from src.utils.utils import (
+    save_numpy_array_data, save_object, load_object, load_numpy_array_data,
+    MONTH_CODES, month_to_time,
+)
+
+
+TARGET_COLUMN = "nht_amount_new_house_transactions"
+
+
+# ===================================================
+# 1️⃣ CONFIGURATION
+# ===================================================
+@dataclass
+class FeatureStoreConfig:
+    """
+    Stores the ingestion output path and the materialized feature store files.
+    """
+    feature_data_path: str = os.path.join("artifacts", "feature_store", "features.csv")
+    features_path: str = os.path.join("final_model", "feature_store", "features.npy")
+    index_path: str = os.path.join("final_model", "feature_store", "index.npy")
+    latest_path: str = os.path.join("final_model", "feature_store", "latest.npy")
+    columns_path: str = os.path.join("final_model", "feature_store", "columns.pkl")
+
+
+# ===================================================
+# 2️⃣ FEATURE STORE CLASS
+# ===================================================
+class FeatureStore:
+    """
+    Online feature store for serving engineered features by (sector, month).
+
+    The feature table is a float32 matrix with one row per (sector_id, time).
+    A dense index[sector_id, time] holds the row number (-1 when missing) and
+    latest[sector_id] holds the row of the most recent month of each sector,
+    so a batch of requests is assembled with a single vectorized gather.
+    """
+
+    def __init__(self):
+        try:
+            self.config = FeatureStoreConfig()
+            self.features = None
+            self.index = None
+            self.latest = None
+            self.columns = None
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    # ---------------------------------------------------
+    # Offline: build the table from the ingestion output
+    # ---------------------------------------------------
+    def materialize(self, feature_data_path):
+        try:
+            logging.info("🚀 Materializing feature store...")
+            data = pd.read_csv(feature_data_path)
+            # First month of each sector has no lag label and was never seen by the model
+            data = data.dropna(subset=["label"])
+            data = data.sort_values(["sector_id", "time"]).reset_index(drop=True)
+
+            # Same column order the preprocessor was fitted on
+            columns = [col for col in data.columns if col not in ["sector_id", TARGET_COLUMN]]
+            features = data[columns].to_numpy(dtype=np.float32)
+
+            sector_ids = data["sector_id"].to_numpy(dtype=np.int64)
+            times = data["time"].to_numpy(dtype=np.int64)
+            rows = np.arange(len(data), dtype=np.int32)
+
+            index = np.full((sector_ids.max() + 1, times.max() + 1), -1, dtype=np.int32)
+            index[sector_ids, times] = rows
+
+            # Rows are sorted by time inside each sector, so the last one is the latest
+            latest = np.full(sector_ids.max() + 1, -1, dtype=np.int32)
+            np.maximum.at(latest, sector_ids, rows)
+
+            save_numpy_array_data(file_path=self.config.features_path, array=features)
+            save_numpy_array_data(file_path=self.config.index_path, array=index)
+            save_numpy_array_data(file_path=self.config.latest_path, array=latest)
+            save_object(file_path=self.config.columns_path, obj=columns)
+
+            logging.info(f"✅ Feature store materialized! Shape: {features.shape}")
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    # ---------------------------------------------------
+    # Online: load the table and gather feature rows
+    # ---------------------------------------------------
+    def load(self):
+        try:
+            if not os.path.exists(self.config.features_path):
+                raise Exception(f"The file {self.config.features_path} is not exists")
+            # Memory-map the table so workers share pages instead of copying it
+            self.features = np.load(self.config.features_path, mmap_mode="r")
+            self.index = load_numpy_array_data(self.config.index_path)
+            self.latest = load_numpy_array_data(self.config.latest_path)
+            self.columns = load_object(self.config.columns_path)
+            logging.info(f"✅ Feature store loaded. Shape: {self.features.shape}")
+            return self
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def get_features(self, sectors, months=None) -> pd.DataFrame:
+        """
+        Assemble the feature matrix for the requested sectors.
+
+        sectors: ids like 5 or "sector 5".
+        months: ids like "2024-Jan"; the latest month of each sector is used when omitted.
+        """
+        try:
+            sector_ids = (
+                pd.Series(sectors, dtype="object").astype(str)
+                .str.extract(r"^(?:sector\s*)?(\d+)$", expand=False)
+            )
+            if sector_ids.isna().any():
+                raise ValueError(f"Unknown sector in request: {sectors}")
+            sector_ids = sector_ids.astype("int64").to_numpy()
+            if (sector_ids >= self.index.shape[0]).any():
+                raise ValueError(f"Unknown sector in request: {sectors}")
+
+            if months is None:
+                rows = self.latest[sector_ids]
+            else:
+                month_parts = (
+                    pd.Series(months, dtype="object").astype(str)
+                    .str.extract(r"^(\d{4})-([A-Za-z]{3})$")
+                )
+                if len(month_parts) != len(sector_ids):
+                    raise ValueError("sectors and months must have the same length")
+                month_nums = month_parts[1].map(MONTH_CODES)
+                if month_nums.isna().any():
+                    raise ValueError(f"Unknown month in request: {months}")
+                times = month_to_time(month_parts[0].astype("int64"), month_nums.astype("int64")).to_numpy()
+                if ((times < 0) | (times >= self.index.shape[1])).any():
+                    raise ValueError(f"Unknown month in request: {months}")
+                rows = self.index[sector_ids, times]
+
+            if (rows < 0).any():
+                missing = np.flatnonzero(rows < 0).tolist()
+                raise ValueError(f"No stored features for request rows: {missing}")
+
+            return pd.DataFrame(self.features[rows], columns=self.columns)
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    # ---------------------------------------------------
+    # Pipeline trigger
+    # ---------------------------------------------------
+    def initiate_feature_store(self) -> FeatureStoreConfig:
+        try:
+            self.materialize(feature_data_path=self.config.feature_data_path)
+            return self.config
+        except Exception as e:
+            raise CustomException(e, sys)
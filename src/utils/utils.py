@@ -5,6 +5,18 @@ from src.logging.logger import logging
 from src.exception.exception import CustomException
 from sklearn.metrics import mean_absolute_error,mean_squared_error,r2_score
 
+MONTH_CODES = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
+    "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
+    "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+BASE_YEAR = 2019
+
+
+def month_to_time(year, month_num):
+    """Months elapsed since January of BASE_YEAR (the "time" feature)."""
+    return (year - BASE_YEAR) * 12 + month_num - 1
+
 def save_numpy_array_data(file_path:str,array:np.array):
     try:
         dir_path = os.path.dirname(file_path)
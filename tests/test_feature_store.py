@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.components.feature_store import FeatureStore
+from src.exception.exception import CustomException
+
+
+@pytest.fixture
+def store(tmp_path):
+    # Sector 1: 2019-Jan has no label, 2019-Mar is a hole (label == 0 filtered upstream)
+    # Sector 2: absent; Sector 3: 2019-Jan has no label
+    data = pd.DataFrame({
+        "sector_id": [1, 1, 1, 3, 3, 3],
+        "time": [0, 1, 3, 0, 1, 2],
+        "month_num": [1, 2, 4, 1, 2, 3],
+        "nht_amount_new_house_transactions": [5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+        "feat": [10.0, 11.0, 13.0, 30.0, 31.0, 32.0],
+        "label": [np.nan, 5.0, 6.0, np.nan, 8.0, 9.0],
+    })
+    csv_path = os.path.join(tmp_path, "features.csv")
+    data.sample(frac=1, random_state=0).to_csv(csv_path, index=False)
+
+    store = FeatureStore()
+    store.config.features_path = os.path.join(tmp_path, "fs", "features.npy")
+    store.config.index_path = os.path.join(tmp_path, "fs", "index.npy")
+    store.config.latest_path = os.path.join(tmp_path, "fs", "latest.npy")
+    store.config.columns_path = os.path.join(tmp_path, "fs", "columns.pkl")
+    store.materialize(csv_path)
+    return store.load()
+
+
+def test_columns_exclude_sector_and_target(store):
+    assert store.columns == ["time", "month_num", "feat", "label"]
+
+
+def test_latest_row_per_sector(store):
+    features = store.get_features(["sector 1", 3])
+    assert features["feat"].tolist() == [13.0, 32.0]
+
+
+def test_explicit_months(store):
+    features = store.get_features([3, "sector 1"], ["2019-Feb", "2019-Apr"])
+    assert features["feat"].tolist() == [31.0, 13.0]
+    assert features["time"].tolist() == [1.0, 3.0]
+
+
+@pytest.mark.parametrize("sectors, months", [
+    ([1], ["2019-Mar"]),   # hole left by the label filter
+    ([1], ["2019-Jan"]),   # first month, no lag label
+    ([2], ["2019-Feb"]),   # sector never ingested
+    ([2], None),           # no latest row for a missing sector
+])
+def test_missing_rows_raise(store, sectors, months):
+    with pytest.raises(CustomException, match="No stored features"):
+        store.get_features(sectors, months)
+
+
+@pytest.mark.parametrize("months", [["2019Feb"], ["2019-Foo"], ["2018-Dec"], ["2030-Jan"]])
+def test_bad_months_raise(store, months):
+    with pytest.raises(CustomException, match="Unknown month"):
+        store.get_features([1], months)
+
+
+@pytest.mark.parametrize("sectors", [["sector"], ["abc"], [99]])
+def test_bad_sectors_raise(store, sectors):
+    with pytest.raises(CustomException, match="Unknown sector"):
+        store.get_features(sectors)
+
+
+def test_length_mismatch_raises(store):
+    with pytest.raises(CustomException, match="same length"):
+        store.get_features([1, 3], ["2019-Feb"])